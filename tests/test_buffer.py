@@ -0,0 +1,59 @@
+"""The flat character buffer must behave like a plain list of line strings"""
+
+import random
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from vim2vid import VideoConfig, VimVideoGenerator
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def generator() -> VimVideoGenerator:
+    config = VideoConfig.from_json(str(ROOT / 'default.json'))
+    config.filename_in_vim = 'test.txt'
+    return VimVideoGenerator(config)
+
+
+def buffer_lines(generator: VimVideoGenerator) -> List[str]:
+    offsets = generator._row_offsets.tolist()
+    return [''.join(generator._content[start:end]) for start, end in zip(offsets, offsets[1:])]
+
+
+def test_edits_match_list_of_lines(generator: VimVideoGenerator) -> None:
+    rng = random.Random(0)
+    lines = [""]
+    row = col = 0
+    
+    for step in range(2000):
+        action = rng.random()
+        if action < 0.55:
+            char = rng.choice("ab é\n")
+            generator._type_character(char)
+            if char == '\n':
+                lines[row:row + 1] = [lines[row][:col], lines[row][col:]]
+                row, col = row + 1, 0
+            else:
+                lines[row] = lines[row][:col] + char + lines[row][col:]
+                col += 1
+        elif action < 0.85:
+            generator._backspace()
+            if col > 0:
+                lines[row] = lines[row][:col - 1] + lines[row][col:]
+                col -= 1
+            elif row > 0:
+                col = len(lines[row - 1])
+                lines[row - 1:row + 1] = [lines[row - 1] + lines[row]]
+                row -= 1
+        else:
+            # Jump the cursor somewhere else in the buffer
+            row = rng.randrange(len(lines))
+            col = rng.randint(0, len(lines[row]))
+            generator.cursor_row, generator.cursor_col = row, col
+        
+        assert buffer_lines(generator) == lines, f"step {step}"
+        assert (generator.cursor_row, generator.cursor_col) == (row, col), f"step {step}"
+        assert len(generator._wrapped_lines) == len(lines), f"step {step}"
@@ -0,0 +1,50 @@
+"""Incremental row redraw must match a full redraw of the same screen"""
+
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vim2vid import VideoConfig, VimVideoGenerator
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def generator() -> VimVideoGenerator:
+    config = VideoConfig.from_json(str(ROOT / 'default.json'))
+    config.filename_in_vim = 'test.txt'
+    config.height = 240  # few visible rows, so edits scroll the view
+    config.highlight_patterns = ['TODO']
+    return VimVideoGenerator(config)
+
+
+def test_incremental_redraw_matches_full_redraw(generator: VimVideoGenerator) -> None:
+    rng = random.Random(0)
+    
+    # Start from the greeting, like a real video
+    generator._render_screen(generator._layout_screen())
+    generator.mode = "INSERT"
+    
+    for step in range(400):
+        action = rng.random()
+        if action < 0.6:
+            generator._type_character(rng.choice("abgjpqy TODO é\n"))
+        elif action < 0.75:
+            generator._backspace()
+        elif action < 0.9:
+            # Jump the cursor somewhere else in the buffer
+            offsets = generator._row_offsets
+            generator.cursor_row = rng.randrange(len(offsets) - 1)
+            row_length = int(offsets[generator.cursor_row + 1] - offsets[generator.cursor_row])
+            generator.cursor_col = rng.randint(0, row_length)
+        else:
+            generator.mode = "NORMAL" if generator.mode == "INSERT" else "INSERT"
+            generator.command_buffer = rng.choice(["", ":w"])
+        
+        screen = generator._layout_screen()
+        incremental = generator._render_screen(screen).copy()
+        generator._drawn_rows = None
+        full = generator._render_screen(screen)
+        np.testing.assert_array_equal(incremental, full, err_msg=f"step {step}")
@@ -5,14 +5,22 @@ Perfect for creating engaging technical content for social media.
 """
 
 import argparse
+import functools
 import json
+import multiprocessing
 import os
+import shutil
+import string
+import subprocess
 import sys
+import tempfile
 import time
-import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from multiprocessing import shared_memory
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, OrderedDict, Tuple, Union
 
 try:
     from vim2vid._version import version as __version__
@@ -24,6 +32,128 @@ import numpy as np
 import cv2
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    from numba import njit
+except ImportError:
+    # Optional: glyph blitting falls back to one NumPy copy per character
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    # Optional: config files are parsed with the standard json module
+    orjson = None  # type: ignore[assignment]
+
+
+def _load_json(f: BinaryIO) -> Any:
+    """Parse JSON from a file opened in binary mode, with orjson when available"""
+    return orjson.loads(f.read()) if orjson else json.load(f)
+
+
+# Maximum number of rendered frames kept in memory. Screens repeat right after a
+# typo is backspaced over, so only the most recent few are ever hit again.
+FRAME_CACHE_SIZE = 8
+
+# Upper bound on the shared memory holding frames rendered by worker processes,
+# well under Docker's default 64 MB /dev/shm
+RENDER_SLOTS_MEMORY = 32 * 1024 * 1024
+
+# Holds at least this long at the start or end of the video are encoded from a
+# single image instead of being piped to ffmpeg frame by frame
+STILL_SEGMENT_SECONDS = 1.0
+
+# Keys hit by mistake while typing
+TYPO_CHARS = 'qwertyuiop'
+
+# Palette entries, one per configured color
+PALETTE_KEYS = ('color_bg', 'color_text', 'color_cursor', 'color_tilde',
+                'color_status', 'color_highlight', 'color_command')
+COLOR_BG, COLOR_TEXT, COLOR_CURSOR, COLOR_TILDE, COLOR_STATUS, COLOR_HIGHLIGHT, COLOR_COMMAND = \
+    range(len(PALETTE_KEYS))
+
+# Glyph styles (foreground on background) in atlas order. Text and highlight come
+# first, and again over the cursor color, so a highlight mask doubles as a
+# per-character style index.
+STYLE_TEXT, STYLE_HIGHLIGHT, STYLE_TILDE, STYLE_COMMAND, STYLE_STATUS, STYLE_CURSOR, \
+    STYLE_TEXT_ON_CURSOR, STYLE_HIGHLIGHT_ON_CURSOR = range(8)
+STYLE_COLORS = [
+    (COLOR_TEXT, COLOR_BG),          # STYLE_TEXT
+    (COLOR_HIGHLIGHT, COLOR_BG),     # STYLE_HIGHLIGHT
+    (COLOR_TILDE, COLOR_BG),         # STYLE_TILDE
+    (COLOR_COMMAND, COLOR_BG),       # STYLE_COMMAND
+    (COLOR_TEXT, COLOR_STATUS),      # STYLE_STATUS
+    (COLOR_BG, COLOR_CURSOR),        # STYLE_CURSOR
+    (COLOR_TEXT, COLOR_CURSOR),      # STYLE_TEXT_ON_CURSOR
+    (COLOR_HIGHLIGHT, COLOR_CURSOR), # STYLE_HIGHLIGHT_ON_CURSOR
+]
+
+# Anti-aliased glyph edges are quantized to this many coverage levels per style,
+# so the palette of base colors and their blends fits the 256 entries of pal8
+GLYPH_COVERAGE_LEVELS = 31
+
+# Hardware H.264 encoders in order of preference, with their 2 Mbps settings
+HARDWARE_ENCODERS = [
+    ('h264_nvenc', ['-preset', 'p4', '-tune', 'hq', '-rc', 'cbr',
+                    '-b:v', '2M', '-maxrate', '2M', '-bufsize', '4M',
+                    '-g', '120', '-bf', '2', '-profile:v', 'main']),
+    ('h264_videotoolbox', ['-b:v', '2M']),
+    ('h264_amf', ['-b:v', '2M']),
+]
+
+# Software fallback
+SOFTWARE_ENCODER = ('libx264', ['-b:v', '2M', '-maxrate', '2M', '-bufsize', '4M',
+                                '-preset', 'medium', '-crf', '23'])
+
+
+def _blit_glyphs_numpy(frame: np.ndarray, atlas: np.ndarray, masks: np.ndarray,
+                       ink: np.ndarray, glyphs: np.ndarray, styles: np.ndarray,
+                       x0: int, y: int, step: int) -> None:
+    """Blit a row of glyph tiles into the frame with one masked copy per glyph"""
+    glyph_height, glyph_width = masks.shape[1:]
+    top = max(0, -y)
+    bottom = min(glyph_height, frame.shape[0] - y)
+    if bottom <= top:
+        return
+    
+    for i, (g, s) in enumerate(zip(glyphs.tolist(), styles.tolist())):
+        if not ink[g]:
+            continue
+        x = x0 + i * step
+        left = max(0, -x)
+        right = min(glyph_width, frame.shape[1] - x)
+        if right <= left:
+            continue
+        np.copyto(frame[y + top:y + bottom, x + left:x + right],
+                  atlas[g, s, top:bottom, left:right],
+                  where=masks[g, top:bottom, left:right])
+
+
+def _blit_glyphs_native(frame: np.ndarray, atlas: np.ndarray, masks: np.ndarray,
+                        ink: np.ndarray, glyphs: np.ndarray, styles: np.ndarray,
+                        x0: int, y: int, step: int) -> None:
+    """Blit a row of glyph tiles pixel by pixel, meant to be compiled with numba"""
+    frame_height, frame_width = frame.shape
+    glyph_height, glyph_width = masks.shape[1], masks.shape[2]
+    
+    for i in range(glyphs.shape[0]):
+        g = glyphs[i]
+        if not ink[g]:
+            continue
+        s = styles[i]
+        x = x0 + i * step
+        for r in range(glyph_height):
+            fy = y + r
+            if fy < 0 or fy >= frame_height:
+                continue
+            for c in range(glyph_width):
+                fx = x + c
+                if fx < 0 or fx >= frame_width or not masks[g, r, c]:
+                    continue
+                frame[fy, fx] = atlas[g, s, r, c]
+
+
+_blit_glyphs = njit(cache=True)(_blit_glyphs_native) if njit else _blit_glyphs_numpy
+
 
 @dataclass
 class VideoConfig:
@@ -71,6 +201,9 @@ class VideoConfig:
     highlight_patterns: List[str]
     special_sequences: dict
     
+    # Performance (1 = render in the main process, 0 = one render process per usable CPU)
+    render_workers: int = 1
+    
     # Runtime properties (not in config file)
     filename_in_vim: str = field(default="", init=False)
     greeting_lines: List[str] = field(default_factory=list, init=False)
@@ -78,8 +211,8 @@ class VideoConfig:
     @classmethod
     def from_json(cls, path: str) -> 'VideoConfig':
         """Load configuration from JSON file"""
-        with open(path, 'r') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            data = _load_json(f)
         
         # Convert color lists to tuples
         for key in data:
@@ -94,8 +227,8 @@ class VideoConfig:
         config_dir = os.path.dirname(path)
         greeting_path = os.path.join(config_dir, greeting_file)
         
-        with open(greeting_path, 'r') as f:
-            greeting_data = json.load(f)
+        with open(greeting_path, 'rb') as f:
+            greeting_data = _load_json(f)
             config.greeting_lines = greeting_data.get('lines', [])
         
         return config
@@ -111,24 +244,100 @@ class VimVideoGenerator:
     
     def __init__(self, config: VideoConfig):
         self.config = config
-        self.lines = [""]
+        # Buffer text as one flat list of characters; line i spans
+        # _content[_row_offsets[i]:_row_offsets[i + 1]]
+        self._content: List[str] = []
+        self._row_offsets = np.zeros(2, dtype=np.int32)
+        # Wrapped display lines per buffer line; None marks a row to re-wrap
+        self._wrapped_lines: List[Optional[Tuple[str, ...]]] = [None]
         self.cursor_row = 0
         self.cursor_col = 0
         self.mode = "NORMAL"
         self.command_buffer = ""
         self.scroll_offset = 0
-        self.video_writer = None
+        self._highlight_patterns = tuple(config.highlight_patterns)
+        
+        # Frames hold palette indices: the config colors (BGR) at their COLOR_* ids,
+        # then for each style its background-to-foreground blends by glyph coverage
+        base = np.array([getattr(config, key)[::-1] for key in PALETTE_KEYS], dtype=np.float64)
+        coverage = np.arange(1, GLYPH_COVERAGE_LEVELS + 1)[:, None] / GLYPH_COVERAGE_LEVELS
+        blends = [base[bg] + (base[fg] - base[bg]) * coverage for fg, bg in STYLE_COLORS]
+        self._palette = np.rint(np.concatenate([base, *blends])).astype(np.uint8)
+        
+        # The same palette as ffmpeg's pal8 expects it: 256 native-endian ARGB words
+        argb = np.zeros(256, dtype=np.uint32)
+        b, g, r = self._palette.astype(np.uint32).T
+        argb[:len(self._palette)] = 0xFF000000 | r << 16 | g << 8 | b
+        self._palette_argb = argb.view(np.uint8)
+        self.ffmpeg = None
+        self.video_writer = None  # OpenCV fallback when ffmpeg is missing
+        
+        # With ffmpeg the video is encoded in segments, joined when it is closed
+        self._output_file: Optional[str] = None
+        self._encoder = SOFTWARE_ENCODER
+        self._segment_dir: Optional[str] = None
+        self._segments: List[str] = []
+        self._segment_jobs: List[subprocess.Popen] = []
+        
+        # Run of identical screens not yet handed to the renderer
+        self._pending_screen: Optional[tuple] = None
+        self._pending_count = 0
+        
+        # Rendered frames keyed by screen, so repeated screens skip rasterization
+        self._frame_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        
+        # Render pool: runs are written in order, each a frame or a worker's slot
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._slots: Optional[np.ndarray] = None
+        self._free_slots: List[int] = []
+        self._runs: deque = deque()
         
         # Load font
         self.font = self._load_font()
         self.char_width, self.char_height = self._calculate_char_size()
         
+        # Pre-rasterized glyph atlas: ASCII at its code point, other characters appended
+        self._extra_glyphs: Dict[str, int] = {}
+        self._build_glyph_atlas()
+        
         # Auto-adjust width based on columns to ensure text fits
         required_width = (self.config.columns * self.char_width) + 100  # 100px for margins
         if self.config.width < required_width:
             print(f"📐 Auto-adjusting width from {self.config.width} to {required_width} to fit {self.config.columns} columns")
             self.config.width = required_width
         
+        # H.264 in yuv420p subsamples chroma 2x2, so round odd dimensions up to even
+        self.config.width += self.config.width % 2
+        self.config.height += self.config.height % 2
+        
+        # Persistent palette-indexed frame buffer rendered into in place, cleared
+        # from a blank copy
+        self._background = np.full((self.config.height, self.config.width), COLOR_BG,
+                                   dtype=np.uint8)
+        self._frame_buf = np.empty_like(self._background)
+        
+        # A pal8 frame as piped to ffmpeg: the indices followed by the palette
+        self._packet = np.concatenate([self._background.ravel(), self._palette_argb])
+        self._packet_pixels = self._packet[:self._background.size].reshape(self._background.shape)
+        
+        # BGR expansion for PNG stills and the OpenCV writer, as a per-channel LUT over
+        # the index replicated to three channels
+        self._palette_lut = np.zeros((256, 1, 3), dtype=np.uint8)
+        self._palette_lut[:len(self._palette), 0] = self._palette
+        self._indices_bgr = np.empty((*self._background.shape, 3), dtype=np.uint8)
+        self._frame_bgr = np.empty_like(self._indices_bgr)
+        
+        # What each content row of the frame buffer currently shows, as (line, cursor
+        # column); None when the buffer holds something else, like the greeting
+        self._drawn_rows: Optional[List[tuple]] = None
+        
+        # Rows are redrawn in bands starting 2px above the text (the cursor block's
+        # top). A row's cursor block and descenders can spill into the next bands.
+        row_height = self.char_height + 4
+        row_extent = max(self.glyph_height + 2, self.char_height + 5)
+        self._row_spill = (row_extent - 1) // row_height
+        
     def _load_font(self) -> ImageFont.FreeTypeFont:
         """Load the best available monospace font"""
         if self.config.font_path and Path(self.config.font_path).exists():
@@ -158,95 +367,280 @@ class VimVideoGenerator:
         bbox = self.font.getbbox("M")
         return bbox[2] - bbox[0], bbox[3] - bbox[1]
     
+    def _build_glyph_atlas(self) -> None:
+        """Rasterize ASCII once for every style used on screen"""
+        printable = string.ascii_letters + string.digits + string.punctuation
+        bottoms = [self.font.getbbox(char)[3] for char in printable]
+        rights = [self.font.getbbox(char)[2] for char in printable]
+        self.glyph_width = max([self.char_width] + rights)
+        self.glyph_height = max([self.char_height] + bottoms)
+        
+        # Atlas tiles are (glyph, style, y, x) palette indices; ink masks are shared
+        # by all styles
+        num_styles = len(STYLE_COLORS)
+        self._atlas = np.zeros((128, num_styles, self.glyph_height, self.glyph_width),
+                               dtype=np.uint8)
+        self._atlas_mask = np.zeros((128, self.glyph_height, self.glyph_width), dtype=bool)
+        for code in range(32, 127):
+            self._atlas[code], self._atlas_mask[code] = self._rasterize_glyph(chr(code))
+        self._atlas_ink = self._atlas_mask.any(axis=(1, 2))
+    
+    def _rasterize_glyph(self, char: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Render a character in every style, returning palette index tiles and its ink mask"""
+        coverage = Image.new('L', (self.glyph_width, self.glyph_height), 0)
+        ImageDraw.Draw(coverage).text((0, 0), char, fill=255, font=self.font)
+        
+        # Each style's blends follow the base colors, one entry per coverage level
+        levels = (np.array(coverage, dtype=np.int32) * GLYPH_COVERAGE_LEVELS + 127) // 255
+        mask = levels > 0
+        style_starts = len(PALETTE_KEYS) + GLYPH_COVERAGE_LEVELS * np.arange(len(STYLE_COLORS))
+        tiles = np.where(mask, style_starts[:, None, None] + levels - 1, COLOR_BG)
+        return tiles.astype(np.uint8), mask
+    
+    def _glyph_ids(self, text: str) -> np.ndarray:
+        """Map a string to atlas indices, rasterizing unseen non-ASCII characters"""
+        if text.isascii():
+            return np.frombuffer(text.encode('ascii'), dtype=np.uint8).astype(np.int32)
+        
+        ids = []
+        for char in text:
+            code = ord(char)
+            if code >= 128:
+                code = self._extra_glyphs.get(char)
+                if code is None:
+                    tiles, mask = self._rasterize_glyph(char)
+                    code = len(self._atlas)
+                    self._atlas = np.concatenate([self._atlas, tiles[None]])
+                    self._atlas_mask = np.concatenate([self._atlas_mask, mask[None]])
+                    self._atlas_ink = np.append(self._atlas_ink, mask.any())
+                    self._extra_glyphs[char] = code
+            ids.append(code)
+        return np.array(ids, dtype=np.int32)
+    
+    def _blit_text(self, frame: np.ndarray, text: str, x: int, y: int,
+                   style: Union[int, np.ndarray]) -> None:
+        """Draw a string one monospace cell at a time, in one style or one per character"""
+        glyphs = self._glyph_ids(text)
+        if isinstance(style, int):
+            style = np.full(len(glyphs), style, dtype=np.uint8)
+        _blit_glyphs(frame, self._atlas, self._atlas_mask, self._atlas_ink,
+                     glyphs, style, x, y, self.char_width)
+    
     def generate(self, text_file: str, output_file: str) -> None:
         """Generate video from text file"""
         # Read input text
         with open(text_file, 'r', encoding='utf-8') as f:
             text = f.read()
         
-        # Initialize video writer
+        # Start the encoder and the render workers feeding it
         self._init_video(output_file)
         
         try:
+            self._prerender_greeting()
+            self._start_renderer()
+            
             # Generate the video
             self._simulate_typing(text)
+            self._flush_frames()
             
         finally:
-            # Always close the video writer first
-            if self.video_writer:
-                self.video_writer.release()
-                self.video_writer = None
-        
-        # Now compress after video is properly closed
-        raw_size = os.path.getsize(output_file) / (1024 * 1024)
-        print(f"✅ Raw video saved: {output_file} ({raw_size:.2f} MB)")
+            # Always close the encoder so the file gets finalized
+            self._stop_renderer()
+            self._close_video()
         
-        # Compress with ffmpeg if available
-        self._compress_video(output_file)
+        final_size = os.path.getsize(output_file) / (1024 * 1024)
+        print(f"✅ Video saved: {output_file} ({final_size:.2f} MB)")
     
     def _init_video(self, output_file: str) -> None:
-        """Initialize video writer with MP4/H.264 and 2 Mbps bitrate"""
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        """Prepare MP4/H.264 encoding at 2 Mbps with ffmpeg, or OpenCV without it
+        
+        ffmpeg encodes the video in segments next to the output file: long holds at
+        the start and end from a single image each, everything between from raw
+        frames piped to it. _close_video joins them into output_file.
+        """
+        if not shutil.which('ffmpeg'):
+            print("💡 ffmpeg not found, falling back to OpenCV. Install ffmpeg for smaller file sizes")
+            self._init_opencv_video(output_file)
+            return
+        
+        self._encoder = self._select_encoder()
+        print(f"🎞️  Encoding with {self._encoder[0]}")
+        
+        self._output_file = output_file
+        self._segment_dir = tempfile.mkdtemp(
+            prefix='.vim2vid-', dir=os.path.dirname(os.path.abspath(output_file)))
+    
+    def _next_segment(self) -> str:
+        """Reserve the path of the next video segment, in playback order"""
+        path = os.path.join(self._segment_dir, f'{len(self._segments)}.mp4')
+        self._segments.append(path)
+        return path
+    
+    def _start_pipe_segment(self) -> None:
+        """Start an ffmpeg process encoding raw frames from stdin into a new segment"""
+        encoder, encoder_args = self._encoder
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'pal8',
+            '-s', f'{self.config.width}x{self.config.height}',
+            '-r', str(self.config.fps), '-i', '-',
+            '-c:v', encoder, *encoder_args,
+            '-pix_fmt', 'yuv420p',
+            self._next_segment()
+        ]
+        
+        # Frames are larger than the default pipe buffer, so writes go straight to the fd
+        self.ffmpeg = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    
+    def _encode_still(self, frame: np.ndarray, count: int) -> None:
+        """Encode count copies of one frame into a new segment, from a single PNG"""
+        segment = self._next_segment()
+        image = segment[:-len('.mp4')] + '.png'
+        cv2.imwrite(image, self._expand_frame(frame))
+        
+        encoder, encoder_args = self._encoder
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-loop', '1', '-framerate', str(self.config.fps), '-i', image,
+            '-frames:v', str(count),
+            '-c:v', encoder, *encoder_args,
+            '-pix_fmt', 'yuv420p',
+            segment
+        ]
+        
+        # Runs alongside the frame pipe; _close_video waits for it
+        self._segment_jobs.append(subprocess.Popen(cmd, stdin=subprocess.DEVNULL,
+                                                   stderr=subprocess.PIPE))
+    
+    def _init_opencv_video(self, output_file: str) -> None:
+        """Initialize an OpenCV video writer, preferring H.264 over MPEG-4"""
+        size = (self.config.width, self.config.height)
+        
+        for codec in ('avc1', 'mp4v'):
+            fourcc = cv2.VideoWriter_fourcc(*codec)
+            self.video_writer = cv2.VideoWriter(output_file, fourcc, self.config.fps, size)
+            if self.video_writer.isOpened():
+                return
+        
+        self.video_writer = None
+        raise RuntimeError("Failed to initialize video writer")
+    
+    def _prerender_greeting(self) -> None:
+        """Render the greeting screen once, before any worker is up
+        
+        The greeting hold opens every video, so caching it here means the first run
+        is written straight away instead of waiting for the render pool to start.
+        """
+        if not self.config.show_greeting:
+            return
+        
+        screen = self._layout_screen()
+        self._cache_frame(screen, self._render_screen(screen).copy())
+    
+    def _start_renderer(self) -> None:
+        """Start a process pool rendering frames into shared memory slots"""
+        workers = self.config.render_workers or _usable_cpus()
+        if workers <= 1:
+            return
+        
+        # Two slots per worker keeps every worker busy while the oldest run is written,
+        # as far as the shared memory budget allows
+        frame_shape = (self.config.height, self.config.width)
+        num_slots = max(2, min(2 * workers, RENDER_SLOTS_MEMORY // int(np.prod(frame_shape))))
+        workers = min(workers, num_slots)
+        self._shm = shared_memory.SharedMemory(create=True, size=num_slots * int(np.prod(frame_shape)))
+        self._slots = np.ndarray((num_slots, *frame_shape), dtype=np.uint8, buffer=self._shm.buf)
+        self._free_slots = list(range(num_slots))
         
-        self.video_writer = cv2.VideoWriter(
-            output_file, fourcc, self.config.fps,
-            (self.config.width, self.config.height)
+        print(f"🧵 Rendering with {workers} processes")
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_render_worker, initargs=(self.config, self._shm.name, num_slots)
         )
+    
+    def _stop_renderer(self) -> None:
+        """Shut down the render pool and release its shared memory"""
+        self._runs.clear()
         
-        # Set 2 Mbps bitrate if possible
-        try:
-            self.video_writer.set(cv2.CAP_PROP_BITRATE, 2000000)  # 2 Mbps
-        except:
-            pass  # Some OpenCV builds don't support this
+        if self._pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
         
-        if not self.video_writer.isOpened():
-            raise RuntimeError("Failed to initialize video writer")
+        if self._shm:
+            self._slots = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+    
+    def _select_encoder(self) -> Tuple[str, List[str]]:
+        """Pick a hardware H.264 encoder if one works on this machine, else libx264"""
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True)
+        
+        for encoder, args in HARDWARE_ENCODERS:
+            if encoder not in result.stdout:
+                continue
             
-    def _compress_video(self, output_file: str) -> None:
-        """Compress video using ffmpeg if available"""
-        import subprocess
-        import shutil
+            # Builds often list encoders the hardware can't run, so try one frame
+            probe = subprocess.run([
+                'ffmpeg', '-hide_banner', '-loglevel', 'error',
+                '-f', 'lavfi', '-i', 'color=black:s=256x256:r=1', '-frames:v', '1',
+                '-c:v', encoder, *args, '-f', 'null', '-'
+            ], capture_output=True)
+            if probe.returncode == 0:
+                return encoder, args
         
-        # Check if ffmpeg is available
-        if not shutil.which('ffmpeg'):
-            final_size = os.path.getsize(output_file) / (1024 * 1024)
-            print(f"💡 Install ffmpeg for smaller file sizes. Current: {final_size:.2f} MB")
+        return SOFTWARE_ENCODER
+    
+    def _close_video(self) -> None:
+        """Flush remaining frames and wait for the encoder to finish the file"""
+        if self.video_writer:
+            self.video_writer.release()
+            self.video_writer = None
+        
+        if not self._segment_dir:
             return
         
         try:
-            temp_file = output_file.replace('.mp4', '_temp.mp4')
-            
-            # Compress with ffmpeg - good quality at 2 Mbps
-            cmd = [
-                'ffmpeg', '-i', output_file,
-                '-c:v', 'libx264', '-b:v', '2M', '-maxrate', '2M', '-bufsize', '4M',
-                '-preset', 'medium', '-crf', '23',
-                '-movflags', '+faststart',
-                '-y', temp_file
-            ]
+            if self.ffmpeg:
+                try:
+                    self.ffmpeg.stdin.close()
+                except BrokenPipeError:
+                    pass  # ffmpeg already exited, its stderr explains why
+                self._segment_jobs.append(self.ffmpeg)
+                self.ffmpeg = None
             
-            print("🗜️  Re-compressing video with ffmpeg...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            for job in self._segment_jobs:
+                stderr = job.stderr.read().decode(errors='replace').strip()
+                returncode = job.wait()
+                if returncode != 0:
+                    raise RuntimeError(f"ffmpeg failed (return code: {returncode}): {stderr}")
             
-            if result.returncode == 0 and os.path.exists(temp_file):
-                # Replace original with compressed version
-                os.replace(temp_file, output_file)
-                
-                final_size = os.path.getsize(output_file) / (1024 * 1024)
-                print(f"✅ Compressed video: {output_file} ({final_size:.2f} MB)")
-            else:
-                # Compression failed, clean up temp file
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                final_size = os.path.getsize(output_file) / (1024 * 1024)
-                print(f"❌ Compression failed (return code: {result.returncode}). Keeping original: {final_size:.2f} MB")
-                print("🔍 Full ffmpeg output:")
-                print("STDOUT:", result.stdout)
-                print("STDERR:", result.stderr)
-                
-        except Exception as e:
-            final_size = os.path.getsize(output_file) / (1024 * 1024)
-            print(f"❌ Compression error: {e}. Current: {final_size:.2f} MB")
+            if self._segments:
+                self._join_segments()
+        finally:
+            shutil.rmtree(self._segment_dir, ignore_errors=True)
+            self._segment_dir = None
+            self._segments = []
+            self._segment_jobs = []
+    
+    def _join_segments(self) -> None:
+        """Concatenate the encoded segments into the output file without re-encoding"""
+        segment_list = os.path.join(self._segment_dir, 'segments.txt')
+        with open(segment_list, 'w') as f:
+            for segment in self._segments:
+                f.write(f"file '{os.path.basename(segment)}'\n")
+        
+        result = subprocess.run([
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-f', 'concat', '-i', segment_list,
+            '-c', 'copy', '-movflags', '+faststart',
+            self._output_file
+        ], stdin=subprocess.DEVNULL, capture_output=True)
+        
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors='replace').strip()
+            raise RuntimeError(f"ffmpeg failed (return code: {result.returncode}): {stderr}")
     
     def _simulate_typing(self, text: str) -> None:
         """Simulate VIM typing with the text"""
@@ -285,6 +679,13 @@ class VimVideoGenerator:
         total_chars = sum(len(line) for line in lines)
         chars_typed = 0
         
+        # Draw every random decision up front, one entry per typed character
+        rng = np.random.default_rng()
+        mistakes = (rng.random(total_chars) < self.config.mistake_rate).tolist()
+        bursts = (rng.random(total_chars) < self.config.burst_probability).tolist()
+        jitters = rng.uniform(-1.0, 1.0, total_chars).tolist()
+        typos = rng.integers(0, len(TYPO_CHARS), total_chars).tolist()
+        
         print(f"⌨️  Typing {total_chars} characters...")
         
         for line_idx, line in enumerate(lines):
@@ -314,12 +715,12 @@ class VimVideoGenerator:
                 self._type_character(char)
                 
                 # Calculate pause duration
-                pause = self._calculate_pause(char)
+                pause = self._calculate_pause(char, bursts[chars_typed], jitters[chars_typed])
                 self._add_frame(pause)
                 
                 # Random mistake
-                if random.random() < self.config.mistake_rate and char_idx > 5:
-                    self._make_mistake()
+                if mistakes[chars_typed] and char_idx > 5:
+                    self._make_mistake(TYPO_CHARS[typos[chars_typed]])
                 
                 char_idx += 1
                 chars_typed += 1
@@ -358,9 +759,8 @@ class VimVideoGenerator:
             self._type_character(char)
             self._add_frame(self.config.typing_speed_base)
     
-    def _make_mistake(self) -> None:
+    def _make_mistake(self, wrong_char: str) -> None:
         """Make and correct a typing mistake"""
-        wrong_char = random.choice('qwertyuiop')
         self._type_character(wrong_char)
         self._add_frame(0.15)
         
@@ -369,8 +769,11 @@ class VimVideoGenerator:
         self._backspace()
         self._add_frame(0.1)
     
-    def _calculate_pause(self, char: str) -> float:
-        """Calculate pause duration after a character"""
+    def _calculate_pause(self, char: str, burst: bool, jitter: float) -> float:
+        """Calculate pause duration after a character
+        
+        burst and jitter (in [-1, 1]) are this character's pre-drawn random values.
+        """
         if char in '.!?':
             return self.config.sentence_pause
         elif char in ',;:':
@@ -379,77 +782,243 @@ class VimVideoGenerator:
             return self.config.space_pause
         else:
             # Variable typing speed
-            if random.random() < self.config.burst_probability:
+            if burst:
                 return self.config.burst_speed
             else:
                 base = self.config.typing_speed_base
                 variance = base * self.config.typing_speed_variance
-                return base + random.uniform(-variance, variance)
+                return base + jitter * variance
     
     def _type_character(self, char: str) -> None:
         """Add a character at cursor position"""
-        if self.cursor_row >= len(self.lines):
-            self.lines.append("")
+        if self.cursor_row >= len(self._wrapped_lines):
+            self._row_offsets = np.append(self._row_offsets, self._row_offsets[-1])
+            self._wrapped_lines.append(None)
         
-        line = self.lines[self.cursor_row]
+        position = int(self._row_offsets[self.cursor_row]) + self.cursor_col
+        self._wrapped_lines[self.cursor_row] = None
         
         if char == '\n':
-            rest = line[self.cursor_col:]
-            self.lines[self.cursor_row] = line[:self.cursor_col]
+            # Splitting a line only adds a row boundary at the cursor
             self.cursor_row += 1
-            self.lines.insert(self.cursor_row, rest)
+            self._row_offsets = np.insert(self._row_offsets, self.cursor_row, position)
+            self._wrapped_lines.insert(self.cursor_row, None)
             self.cursor_col = 0
         else:
-            self.lines[self.cursor_row] = line[:self.cursor_col] + char + line[self.cursor_col:]
+            self._content.insert(position, char)
+            self._row_offsets[self.cursor_row + 1:] += 1
             self.cursor_col += 1
     
     def _backspace(self) -> None:
         """Delete character before cursor"""
+        offsets = self._row_offsets
         if self.cursor_col > 0:
-            line = self.lines[self.cursor_row]
-            self.lines[self.cursor_row] = line[:self.cursor_col - 1] + line[self.cursor_col:]
+            del self._content[int(offsets[self.cursor_row]) + self.cursor_col - 1]
+            offsets[self.cursor_row + 1:] -= 1
+            self._wrapped_lines[self.cursor_row] = None
             self.cursor_col -= 1
         elif self.cursor_row > 0:
-            prev_line = self.lines[self.cursor_row - 1]
-            current_line = self.lines[self.cursor_row]
-            self.cursor_col = len(prev_line)
-            self.lines[self.cursor_row - 1] = prev_line + current_line
-            del self.lines[self.cursor_row]
+            # Joining with the previous line only drops the row boundary
+            self.cursor_col = int(offsets[self.cursor_row] - offsets[self.cursor_row - 1])
+            self._row_offsets = np.delete(offsets, self.cursor_row)
+            self._wrapped_lines[self.cursor_row - 1] = None
+            del self._wrapped_lines[self.cursor_row]
             self.cursor_row -= 1
     
     def _add_frame(self, duration: float) -> None:
         """Add frame(s) to video for given duration"""
-        frame = self._render_frame()
+        screen = self._layout_screen()
         num_frames = max(1, int(duration * self.config.fps))
         
-        for _ in range(num_frames):
-            self.video_writer.write(frame)
+        if screen == self._pending_screen:
+            self._pending_count += num_frames
+        else:
+            self._end_run()
+            self._pending_screen = screen
+            self._pending_count = num_frames
+    
+    def _end_run(self) -> None:
+        """Hand the pending run of identical screens to the renderer"""
+        if self._pending_screen is None:
+            return
+        
+        screen, count = self._pending_screen, self._pending_count
+        self._pending_screen = None
+        self._pending_count = 0
+        
+        frame = self._frame_cache.get(screen)
+        if frame is not None:
+            self._frame_cache.move_to_end(screen)
+            self._runs.append((frame, None, count, screen))
+        elif self._pool is None:
+            frame = self._render_screen(screen).copy()
+            self._cache_frame(screen, frame)
+            self._runs.append((frame, None, count, screen))
+        else:
+            while not self._free_slots:
+                self._write_oldest_run()
+            slot = self._free_slots.pop()
+            future = self._pool.submit(_render_in_worker, screen, slot)
+            self._runs.append((future, slot, count, screen))
+        
+        # Write out everything that is already rendered, keeping frame order. The
+        # newest run stays queued until another follows, in case it is the last hold.
+        while len(self._runs) > 1 and (self._runs[0][1] is None or self._runs[0][0].done()):
+            self._write_oldest_run()
+    
+    def _flush_frames(self) -> None:
+        """Render and write every run still in flight"""
+        self._end_run()
+        while self._runs:
+            self._write_oldest_run(last=len(self._runs) == 1)
+    
+    def _write_oldest_run(self, last: bool = False) -> None:
+        """Wait for the oldest run to be rendered and send it to the encoder"""
+        frame, slot, count, screen = self._runs.popleft()
+        
+        if slot is not None:
+            frame.result()  # re-raises errors from the worker
+            frame = self._slots[slot].copy()
+            self._free_slots.append(slot)
+            self._cache_frame(screen, frame)
+        
+        if self.video_writer:
+            bgr = self._expand_frame(frame)
+            for _ in range(count):
+                self.video_writer.write(bgr)
+            return
+        
+        if self._segment_dir:
+            # Long holds opening or closing the video skip the frame pipe
+            is_edge = last or not self._segments
+            if is_edge and count >= STILL_SEGMENT_SECONDS * self.config.fps:
+                self._encode_still(frame, count)
+                return
+            if not self.ffmpeg:
+                self._start_pipe_segment()
+        
+        np.copyto(self._packet_pixels, frame)
+        self._write_repeated(memoryview(self._packet), count)
+    
+    def _write_repeated(self, data: memoryview, count: int) -> None:
+        """Write the same frame bytes to ffmpeg count times without copying them"""
+        if not hasattr(os, 'writev'):
+            for _ in range(count):
+                self.ffmpeg.stdin.write(data)
+            return
+        
+        # Gather a whole run into as few syscalls as the iovec limit allows
+        self.ffmpeg.stdin.flush()
+        fd = self.ffmpeg.stdin.fileno()
+        iov_max = os.sysconf('SC_IOV_MAX')
+        if iov_max <= 0:
+            iov_max = 1024
+        
+        offset = 0  # bytes of the current frame already written
+        while count:
+            batch = min(count, iov_max)
+            written = os.writev(fd, [data[offset:]] + [data] * (batch - 1))
+            done, offset = divmod(offset + written, len(data))
+            count -= done
     
-    def _render_frame(self) -> np.ndarray:
-        """Render current VIM state as frame"""
-        # Create image
-        img = Image.new('RGB', (self.config.width, self.config.height), self.config.color_bg)
-        draw = ImageDraw.Draw(img)
+    def _expand_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a palette-indexed frame to BGR in a reused buffer"""
+        cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR, dst=self._indices_bgr)
+        return cv2.LUT(self._indices_bgr, self._palette_lut, dst=self._frame_bgr)
+    
+    def _cache_frame(self, screen: tuple, frame: np.ndarray) -> None:
+        """Remember a rendered frame, evicting the least recently used one"""
+        self._frame_cache[screen] = frame
+        if len(self._frame_cache) > FRAME_CACHE_SIZE:
+            self._frame_cache.popitem(last=False)
+    
+    def _layout_screen(self) -> tuple:
+        """Describe what the screen shows for the current VIM state
+        
+        The result is everything rendering needs: (rows, cursor, status text,
+        command line), where rows is None for the greeting, otherwise the visible
+        display lines with None for "~" rows, and cursor is (screen row, column)
+        or None. Auto-scrolling happens here, so rendering has no state to update.
+        """
+        status_text = f" {self.config.filename_in_vim} "
+        if self.mode == "INSERT":
+            status_text += "-- INSERT --"
+        status_text += f"  {self.cursor_row + 1},{self.cursor_col + 1}"
+        
+        if not self._content and len(self._wrapped_lines) == 1 and self.mode == "NORMAL":
+            return (None, None, status_text, self.command_buffer)
+        
+        # Decode and re-wrap only the lines edited since the last frame
+        display_lines = []
+        cursor_line_start = 0
+        offsets = self._row_offsets.tolist()
+        
+        for i, wrapped in enumerate(self._wrapped_lines):
+            if wrapped is None:
+                line = ''.join(self._content[offsets[i]:offsets[i + 1]])
+                wrapped = self._wrap_line(line, self.config.columns - 1)
+                self._wrapped_lines[i] = wrapped
+            if i == self.cursor_row:
+                cursor_line_start = len(display_lines)
+            display_lines.extend(wrapped)
+        
+        # Find which wrapped line the cursor is on
+        wrapped = self._wrapped_lines[self.cursor_row]
+        char_count = 0
+        for j, wrapped_line in enumerate(wrapped):
+            if char_count + len(wrapped_line) >= self.cursor_col:
+                cursor_display_row = cursor_line_start + j
+                cursor_display_col = self.cursor_col - char_count
+                break
+            char_count += len(wrapped_line) + 1  # +1 for the space between wrapped words
+        else:
+            # Cursor is at the end
+            cursor_display_row = cursor_line_start + len(wrapped) - 1
+            cursor_display_col = len(wrapped[-1])
+        
+        # Calculate visible area
+        visible_rows = (self.config.height - 100) // (self.char_height + 4)
+        
+        # Auto-scroll when cursor goes below visible area
+        if cursor_display_row >= self.scroll_offset + visible_rows:
+            self.scroll_offset = cursor_display_row - visible_rows + 1
+        elif cursor_display_row < self.scroll_offset:
+            self.scroll_offset = cursor_display_row
+        
+        rows = tuple(display_lines[self.scroll_offset:self.scroll_offset + visible_rows])
+        rows += (None,) * (visible_rows - len(rows))
+        
+        cursor = None
+        if self.mode == "INSERT":
+            cursor = (cursor_display_row - self.scroll_offset, cursor_display_col)
+        
+        return (rows, cursor, status_text, self.command_buffer)
+    
+    def _render_screen(self, screen: tuple) -> np.ndarray:
+        """Render a screen from _layout_screen into the shared palette-indexed frame buffer"""
+        rows, cursor, status_text, command_buffer = screen
+        frame = self._frame_buf
         
         # Show greeting or content
-        if len(self.lines) == 1 and self.lines[0] == "" and self.mode == "NORMAL":
-            self._draw_greeting(draw)
+        if rows is None:
+            np.copyto(frame, self._background)
+            self._draw_greeting(frame)
+            self._drawn_rows = None
         else:
-            self._draw_content(draw)
+            self._draw_content(frame, rows, cursor)
         
-        # Draw status line
-        self._draw_status(draw)
+        # Status and command lines change with every keystroke, so always redraw them
+        status_y = self.config.height - 60
+        np.copyto(frame[status_y:], self._background[status_y:])
+        self._draw_status(frame, status_text)
         
         # Draw command line
-        if self.command_buffer:
-            draw.text((25, self.config.height - 20), self.command_buffer,
-                     fill=self.config.color_command, font=self.font)
+        if command_buffer:
+            self._blit_text(frame, command_buffer, 25, self.config.height - 20, STYLE_COMMAND)
         
-        # Convert to OpenCV format
-        frame_array = np.array(img)
-        return cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
+        return frame
     
-    def _draw_greeting(self, draw: ImageDraw.Draw) -> None:
+    def _draw_greeting(self, frame: np.ndarray) -> None:
         """Draw VIM greeting screen"""
         welcome_lines = self.config.greeting_lines
         
@@ -461,151 +1030,177 @@ class VimVideoGenerator:
             if line:
                 line_width = len(line) * self.char_width
                 x_center = (self.config.width - line_width) // 2
-                draw.text((x_center, y_pos), line, fill=self.config.color_text, font=self.font)
+                self._blit_text(frame, line, x_center, y_pos, STYLE_TEXT)
             
-            draw.text((25, y_pos), "~", fill=self.config.color_tilde, font=self.font)
+            self._blit_text(frame, "~", 25, y_pos, STYLE_TILDE)
             y_pos += self.char_height + 4
     
-    def _wrap_line(self, text: str, width: int) -> list:
-        """Wrap a line of text to fit within the specified width"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _wrap_line(text: str, width: int) -> Tuple[str, ...]:
+        """Wrap a line of text to fit within the specified width
+        
+        Memoized because untouched lines are re-wrapped on every frame.
+        """
         if len(text) <= width:
-            return [text]
+            return (text,)
         
         wrapped = []
-        words = text.split(' ')
-        current_line = ""
+        current = []  # words of the line being built
+        current_len = 0  # length of ' '.join(current)
         
-        for word in words:
-            if len(current_line) + len(word) + 1 <= width:
-                if current_line:
-                    current_line += " " + word
+        for word in text.split(' '):
+            if current_len + len(word) + 1 <= width:
+                if current_len:
+                    current.append(word)
+                    current_len += len(word) + 1
                 else:
-                    current_line = word
+                    current = [word]
+                    current_len = len(word)
             else:
-                if current_line:
-                    wrapped.append(current_line)
-                if len(word) > width:
-                    # Word is too long, split it
-                    while len(word) > width:
-                        wrapped.append(word[:width])
-                        word = word[width:]
-                    current_line = word
-                else:
-                    current_line = word
+                if current_len:
+                    wrapped.append(' '.join(current))
+                # Word is too long, split it
+                while len(word) > width:
+                    wrapped.append(word[:width])
+                    word = word[width:]
+                current = [word]
+                current_len = len(word)
         
-        if current_line:
-            wrapped.append(current_line)
+        if current_len:
+            wrapped.append(' '.join(current))
         
-        return wrapped if wrapped else [""]
+        return tuple(wrapped) if wrapped else ("",)
 
-    def _draw_content(self, draw: ImageDraw.Draw) -> None:
-        """Draw file content with cursor and proper line wrapping"""
-        # Process all lines with wrapping
-        display_lines = []
-        cursor_display_row = 0
-        cursor_display_col = self.cursor_col
-        
-        for i, line in enumerate(self.lines):
-            # Don't wrap if line is empty or short enough
-            if len(line) <= self.config.columns - 1:
-                if i == self.cursor_row:
-                    cursor_display_row = len(display_lines)
-                    cursor_display_col = self.cursor_col
-                display_lines.append(line)
-            else:
-                # Line needs wrapping
-                wrapped = self._wrap_line(line, self.config.columns - 1)
-                if i == self.cursor_row:
-                    # Find which wrapped line the cursor is on
-                    char_count = 0
-                    for j, wrapped_line in enumerate(wrapped):
-                        if char_count + len(wrapped_line) >= self.cursor_col:
-                            cursor_display_row = len(display_lines) + j
-                            cursor_display_col = self.cursor_col - char_count
-                            break
-                        char_count += len(wrapped_line) + 1  # +1 for the space between wrapped words
-                    else:
-                        # Cursor is at the end
-                        cursor_display_row = len(display_lines) + len(wrapped) - 1
-                        cursor_display_col = len(wrapped[-1])
-                display_lines.extend(wrapped)
+    def _draw_content(self, frame: np.ndarray, rows: Tuple[Optional[str], ...],
+                      cursor: Optional[Tuple[int, int]]) -> None:
+        """Draw the visible display lines with cursor, redrawing only rows that changed"""
+        row_height = self.char_height + 4
+        cells = [(line, cursor[1] if cursor and cursor[0] == screen_row else None)
+                 for screen_row, line in enumerate(rows)]
+        previous = self._drawn_rows
+        self._drawn_rows = cells
         
-        # Calculate visible area
-        visible_rows = (self.config.height - 100) // (self.char_height + 4)
+        if previous is None or len(previous) != len(cells):
+            # Nothing reusable in the buffer: clear everything above the status line
+            status_y = self.config.height - 60
+            np.copyto(frame[:status_y], self._background[:status_y])
+            for screen_row, cell in enumerate(cells):
+                self._draw_row(frame, cell, 30 + screen_row * row_height)
+            return
         
-        # Auto-scroll when cursor goes below visible area
-        if cursor_display_row >= self.scroll_offset + visible_rows:
-            self.scroll_offset = cursor_display_row - visible_rows + 1
-        elif cursor_display_row < self.scroll_offset:
-            self.scroll_offset = cursor_display_row
+        # Bands holding pixels of changed rows, before or after the change
+        spill = self._row_spill
+        bands = sorted({band for screen_row, cell in enumerate(cells)
+                        if cell != previous[screen_row]
+                        for band in range(screen_row, screen_row + spill + 1)})
         
-        # Draw wrapped display lines
-        y_pos = 30
-        for screen_row in range(visible_rows):
-            display_idx = screen_row + self.scroll_offset
+        # Clear each contiguous block of bands, then redraw every row reaching into
+        # it, in order, clipped to the block so untouched rows keep their pixels
+        while bands:
+            first = last = bands.pop(0)
+            while bands and bands[0] == last + 1:
+                last = bands.pop(0)
             
-            if display_idx < len(display_lines):
-                line = display_lines[display_idx]
-                # Check if cursor is on this display line
-                if self.mode == "INSERT" and display_idx == cursor_display_row:
-                    self._draw_line_with_cursor(draw, line, cursor_display_col, y_pos)
-                else:
-                    self._draw_line_plain(draw, line, y_pos)
-            else:
-                draw.text((25, y_pos), "~", fill=self.config.color_tilde, font=self.font)
-            
-            y_pos += self.char_height + 4
+            top = 28 + first * row_height
+            bottom = 28 + (last + 1) * row_height
+            region = frame[top:bottom]
+            np.copyto(region, self._background[top:bottom])
+            for screen_row in range(max(0, first - spill), min(len(cells) - 1, last) + 1):
+                self._draw_row(region, cells[screen_row], 30 + screen_row * row_height - top)
+    
+    def _draw_row(self, frame: np.ndarray, cell: tuple, y_pos: int) -> None:
+        """Draw one content row: a "~" filler, or a display line with optional cursor"""
+        line, cursor_col = cell
+        if line is None:
+            self._blit_text(frame, "~", 25, y_pos, STYLE_TILDE)
+        elif cursor_col is not None:
+            self._draw_line_with_cursor(frame, line, cursor_col, y_pos)
+        else:
+            self._draw_line_plain(frame, line, y_pos)
     
-    def _draw_line_with_cursor(self, draw: ImageDraw.Draw, line: str, cursor_col: int, y_pos: int) -> None:
+    def _draw_line_with_cursor(self, frame: np.ndarray, line: str, cursor_col: int, y_pos: int) -> None:
         """Draw a line with cursor at specified position"""
-        x_pos = 25
-        
-        for col, char in enumerate(line):
-            if col == cursor_col:
-                # Draw cursor
-                cursor_rect = [x_pos, y_pos - 2, x_pos + self.char_width + 2, y_pos + self.char_height + 2]
-                draw.rectangle(cursor_rect, fill=self.config.color_cursor)
-                draw.text((x_pos + 1, y_pos), char, fill=self.config.color_bg, font=self.font)
-            else:
-                color = self._get_char_color(line, col)
-                draw.text((x_pos, y_pos), char, fill=color, font=self.font)
-            x_pos += self.char_width
+        styles = np.frombuffer(self._compute_color_mask(line, self._highlight_patterns),
+                               dtype=np.uint8)
+        cursor_x = 25 + cursor_col * self.char_width
         
-        # Cursor at end of line
-        if cursor_col >= len(line):
-            cursor_rect = [x_pos, y_pos - 2, x_pos + self.char_width + 2, y_pos + self.char_height + 2]
-            draw.rectangle(cursor_rect, fill=self.config.color_cursor)
+        # Text before the cursor, then the cursor block over it, then the rest
+        self._blit_text(frame, line[:cursor_col], 25, y_pos, styles[:cursor_col])
+        self._fill_rect(frame, cursor_x, y_pos - 2, cursor_x + self.char_width + 2,
+                        y_pos + self.char_height + 2, COLOR_CURSOR)
+        if cursor_col < len(line):
+            # Clip the character to the block: it is drawn in the background color,
+            # so descenders below the block must stay invisible
+            top = max(y_pos - 2, 0)
+            block = frame[top:y_pos + self.char_height + 3,
+                          cursor_x:cursor_x + self.char_width + 3]
+            self._blit_text(block, line[cursor_col], 1, y_pos - top, STYLE_CURSOR)
+            self._blit_text(frame, line[cursor_col + 1:], cursor_x + self.char_width, y_pos,
+                            styles[cursor_col + 1:])
+            
+            # The next character's left edge overlaps the block, blending into its color
+            if cursor_col + 1 < len(line):
+                overhang = block[:, self.char_width:]
+                self._blit_text(overhang, line[cursor_col + 1], 0, y_pos - top,
+                                styles[cursor_col + 1:cursor_col + 2] + STYLE_TEXT_ON_CURSOR)
     
-    def _draw_line_plain(self, draw: ImageDraw.Draw, line: str, y_pos: int) -> None:
+    def _draw_line_plain(self, frame: np.ndarray, line: str, y_pos: int) -> None:
         """Draw a regular line without cursor"""
-        x_pos = 25
-        
-        for col, char in enumerate(line):
-            color = self._get_char_color(line, col)
-            draw.text((x_pos, y_pos), char, fill=color, font=self.font)
-            x_pos += self.char_width
-    
-    def _get_char_color(self, line: str, col: int) -> Tuple[int, int, int]:
-        """Get color for character based on highlighting rules"""
-        for pattern in self.config.highlight_patterns:
-            if pattern in line:
-                start = line.find(pattern)
-                if start <= col < start + len(pattern):
-                    return self.config.color_highlight
-        return self.config.color_text
-    
-    def _draw_status(self, draw: ImageDraw.Draw) -> None:
+        styles = np.frombuffer(self._compute_color_mask(line, self._highlight_patterns),
+                               dtype=np.uint8)
+        self._blit_text(frame, line, 25, y_pos, styles)
+    
+    def _fill_rect(self, frame: np.ndarray, x0: int, y0: int, x1: int, y1: int,
+                   color: int) -> None:
+        """Fill an inclusive rectangle with a palette color, like ImageDraw.rectangle"""
+        frame[max(y0, 0):y1 + 1, max(x0, 0):x1 + 1] = color
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _compute_color_mask(line: str, patterns: Tuple[str, ...]) -> bytes:
+        """Mark each character with STYLE_HIGHLIGHT if a pattern covers it, else STYLE_TEXT"""
+        mask = bytearray(len(line))
+        for pattern in patterns:
+            # Only the first occurrence of each pattern is highlighted
+            start = line.find(pattern)
+            if start >= 0:
+                mask[start:start + len(pattern)] = b'\x01' * len(pattern)
+        return bytes(mask)
+    
+    def _draw_status(self, frame: np.ndarray, status_text: str) -> None:
         """Draw VIM status line"""
         status_y = self.config.height - 60
-        draw.rectangle([0, status_y, self.config.width, status_y + self.char_height + 12],
-                      fill=self.config.color_status)
-        
-        status_text = f" {self.config.filename_in_vim} "
-        if self.mode == "INSERT":
-            status_text += "-- INSERT --"
-        status_text += f"  {self.cursor_row + 1},{self.cursor_col + 1}"
+        self._fill_rect(frame, 0, status_y, self.config.width, status_y + self.char_height + 12,
+                        COLOR_STATUS)
         
-        draw.text((25, status_y + 6), status_text, fill=self.config.color_text, font=self.font)
+        self._blit_text(frame, status_text, 25, status_y + 6, STYLE_STATUS)
+
+
+# State of a render pool worker process, set up by _init_render_worker
+_worker: dict = {}
+
+
+def _usable_cpus() -> int:
+    """Count the CPUs this process may run on, honoring its affinity mask"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _init_render_worker(config: VideoConfig, shm_name: str, num_slots: int) -> None:
+    """Build a generator for rendering and attach to the shared frame slots"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker['generator'] = VimVideoGenerator(config)
+    _worker['shm'] = shm
+    _worker['slots'] = np.ndarray((num_slots, config.height, config.width),
+                                  dtype=np.uint8, buffer=shm.buf)
+
+
+def _render_in_worker(screen: tuple, slot: int) -> int:
+    """Render a screen into a shared memory slot"""
+    _worker['slots'][slot] = _worker['generator']._render_screen(screen)
+    return slot
 
 
 def display_config_parameters(config: VideoConfig, config_file: str) -> None:
@@ -621,6 +1216,7 @@ def display_config_parameters(config: VideoConfig, config_file: str) -> None:
             ('fps', config.fps),
             ('font_size', config.font_size),
             ('font_path', config.font_path),
+            ('render_workers', config.render_workers),
         ],
         'VIM Display': [
             ('columns', config.columns),